@@ -5,6 +5,15 @@ Child Info Extractor - Extract child IDs and names from ChildPaths HTML
 
 Extracts child information from HTML files and exports to CSV or Excel.
 
+Requires lxml (pip install lxml), whose C-level parser and XPath engine
+handle large pages far faster than a BeautifulSoup tree. If selectolax is
+installed (pip install selectolax), its lexbor parser is used first for
+the standard page layout, with lxml handling anything it cannot.
+
+The module is fully type-annotated so it can optionally be compiled with
+mypyc (mypyc --ignore-missing-imports main.py); Python then imports the
+compiled extension in place of this file.
+
 Author: wolketich
 Last updated: 2025-04-29
 """
@@ -12,12 +21,22 @@ Last updated: 2025-04-29
 import re
 import logging
 import sys
-import csv
 import os
 import argparse
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import List, Dict, Optional, Union
-from bs4 import BeautifulSoup
+from typing import Callable, List, Dict, Optional, Set, Tuple, Union
+from lxml import etree, html as lxml_html
+
+try:
+    # Optional: selectolax's lexbor parser is used for the common page layout when installed
+    from selectolax.lexbor import LexborHTMLParser
+    _HAVE_SELECTOLAX = True
+except ImportError:
+    _HAVE_SELECTOLAX = False
 
 # Set up logging
 logging.basicConfig(
@@ -26,43 +45,118 @@ logging.basicConfig(
 )
 logger = logging.getLogger('child_extractor')
 
+# Non-breaking / thin spaces become plain spaces, zero-width spaces are dropped
+_WHITESPACE_TABLE = str.maketrans({'\xa0': ' ', '\u2009': ' ', '\u200b': ''})
+
+# Characters that force a CSV field to be quoted (same rules as csv.writer's default dialect)
+_CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
+_CSV_FLUSH_SIZE = 1 << 20
+
+
+def _quote_csv_field(value: str) -> str:
+    """Quote a CSV field if it needs it, doubling any embedded quotes."""
+    if _CSV_SPECIAL_RE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor, handling partial writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 class ChildInfoExtractor:
     """Extract child information from ChildPaths HTML."""
     
+    # Link labels stripped from parent-row text when recovering a child's name
+    _COMMON_TEXT_RE = re.compile(r'overview|profile|details', re.IGNORECASE)
+    
+    # Number of recently parsed documents whose results are kept for re-use
+    PARSE_CACHE_SIZE = 32
+    
     def __init__(self, debug: bool = False):
         self.debug = debug
         self.child_id_pattern = re.compile(r'/child/([^/]+)')
-        self.all_children = []
+        self._child_links_xpath = etree.XPath("//a[contains(@href, '/child/')]")
+        self._name_div_xpath = etree.XPath(
+            "string(.//div[contains(concat(' ', normalize-space(@class), ' '), ' col-lg-8 ')"
+            " or contains(concat(' ', normalize-space(@class), ' '), ' col-xs-8 ')])"
+        )
+        self._parent_row_xpath = etree.XPath(
+            "ancestor::div[contains(concat(' ', normalize-space(@class), ' '), ' row ')][1]"
+        )
+        self._leaf_divs_xpath = etree.XPath(".//div[not(*) and text()]")
+        # Used for documents with an XML encoding declaration, which lxml only accepts as bytes
+        self._utf8_parser = lxml_html.HTMLParser(encoding='utf-8')
+        self._word_re = re.compile(r'\w+')
+        # Extracted rows are stored column-wise (one list per field) to avoid a dict per child
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._sources: List[str] = []
+        self._times: List[str] = []
+        self._seen_ids: Set[str] = set()
+        # Parsed (id, name) pairs keyed by a digest of the HTML, so the documents
+        # themselves are not kept alive by the cache
+        self._parse_cache: 'OrderedDict[bytes, Tuple[Tuple[str, str], ...]]' = OrderedDict()
+        self._parse_cache_hits = 0
+        self._parse_cache_misses = 0
+        
+    @property
+    def child_count(self) -> int:
+        """Number of unique children extracted so far."""
+        return len(self._ids)
+    
+    @property
+    def all_children(self) -> List[Dict[str, str]]:
+        """All extracted children as a list of dictionaries (built on access)."""
+        return [
+            {'id': child_id, 'name': name, 'source': source, 'extraction_time': extraction_time}
+            for child_id, name, source, extraction_time in zip(self._ids, self._names, self._sources, self._times)
+        ]
         
-    def _sanitize_text(self, text: Optional[str]) -> str:
+    @staticmethod
+    def _sanitize_text(text: Optional[str]) -> str:
         """Clean up text - handling whitespace, non-breaking spaces, etc."""
         if not text:
             return ""
-        return ' '.join(text.replace('\xa0', ' ').split())
+        return ' '.join(text.translate(_WHITESPACE_TABLE).split())
     
     def _extract_child_id(self, href: str) -> Optional[str]:
         """Pull the child ID from a URL."""
         if not href:
             return None
             
+        # Fast path: slice the segment after the first '/child/' without the regex engine
+        start = href.find('/child/')
+        if start == -1:
+            return None
+        rest = href[start + 7:]
+        end = rest.find('/')
+        child_id = rest if end == -1 else rest[:end]
+        if child_id:
+            return child_id
+            
+        # Unusual URLs such as '/child//...' - let the regex look further along
         match = self.child_id_pattern.search(href)
         return match.group(1) if match else None
     
-    def _find_child_name(self, anchor_tag) -> str:
+    def _find_child_name(self, anchor_tag: lxml_html.HtmlElement) -> str:
         """Extract child name from the anchor tag structure."""
         # First try the expected structure
-        name_div = anchor_tag.find('div', {'class': ['col-lg-8', 'col-xs-8']})
-        
-        if name_div:
-            return self._sanitize_text(name_div.text)
+        name = self._sanitize_text(self._name_div_xpath(anchor_tag))
+        if name:
+            return name
             
         # If that didn't work, try a few common variations
-        alt_name_div = anchor_tag.find('div', text=re.compile(r'\w+'))
-        if alt_name_div:
-            return self._sanitize_text(alt_name_div.text)
+        for div in self._leaf_divs_xpath(anchor_tag):
+            if div.text and self._word_re.search(div.text):
+                return self._sanitize_text(div.text)
             
         # Last resort: just get all text from the anchor
-        all_text = self._sanitize_text(anchor_tag.text)
+        all_text = self._sanitize_text(anchor_tag.text_content())
         if all_text:
             return all_text
             
@@ -103,9 +197,14 @@ class ChildInfoExtractor:
             files = [f for f in os.listdir(dir_path) if f.endswith(extension)]
             logger.info(f"Found {len(files)} {extension} files in {dir_path}")
             
-            for file in files:
-                file_path = os.path.join(dir_path, file)
-                file_results = self.process_file(file_path)
+            # Files are independent, so workers read and parse them in parallel and
+            # only the (id, name) pairs come back to this process
+            file_paths = [os.path.join(dir_path, file) for file in files]
+            all_results = self._extract_in_pool(
+                _parse_path, file_paths, files,
+                lambda file_path, source: self.process_file(file_path)
+            )
+            for file, file_results in zip(files, all_results):
                 results.extend(file_results)
                 logger.info(f"Extracted {len(file_results)} children from {file}")
             
@@ -114,33 +213,79 @@ class ChildInfoExtractor:
             logger.error(f"Failed to process directory {dir_path}: {e}")
             return []
     
-    def extract_from_html(self, html_content: str, source: str = "unknown") -> List[Dict[str, str]]:
+    def _parse_children(self, html_content: str) -> Tuple[Tuple[str, str], ...]:
         """
-        Parse HTML and extract all child information.
+        Parse HTML and pull out (child ID, name) pairs in document order.
+        
+        This does not touch the extractor's collected data, so its results can
+        be cached per document (see extract_from_html).
         
         Args:
             html_content: HTML string to parse
-            source: Source identifier for tracking
             
         Returns:
-            List of dictionaries with child information
+            Tuple of (id, name) tuples
         """
-        if not html_content:
-            logger.warning("Empty HTML content provided")
-            return []
-            
+        if _HAVE_SELECTOLAX:
+            pairs = self._parse_children_fast(html_content)
+            if pairs is not None:
+                return pairs
+        return self._parse_children_lxml(html_content)
+    
+    def _parse_children_fast(self, html_content: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+        """
+        Extract (child ID, name) pairs with selectolax for the standard layout.
+        
+        Returns None if the page doesn't match the expected structure (no child
+        links, or a link without a usable ID or name div) so the caller can
+        fall back to the more forgiving lxml path.
+        """
+        try:
+            tree = LexborHTMLParser(html_content)
+            # Script/style contents are not part of any visible name
+            tree.strip_tags(['script', 'style'])
+            child_links = tree.css("a[href*='/child/']")
+        except Exception as e:
+            logger.debug(f"selectolax could not parse HTML, falling back to lxml: {e}")
+            return None
+        
+        if not child_links:
+            return None
+        
+        pairs = []
+        for a_tag in child_links:
+            child_id = self._extract_child_id(a_tag.attributes.get('href') or '')
+            name_div = a_tag.css_first('div.col-lg-8, div.col-xs-8')
+            if not child_id or name_div is None:
+                return None
+            child_name = self._sanitize_text(name_div.text())
+            if not child_name:
+                return None
+            pairs.append((child_id, child_name))
+        
+        return tuple(pairs)
+    
+    def _parse_children_lxml(self, html_content: str) -> Tuple[Tuple[str, str], ...]:
+        """Extract (child ID, name) pairs with lxml, trying several name fallbacks."""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            try:
+                tree = lxml_html.fromstring(html_content)
+            except ValueError:
+                # e.g. XHTML starting with <?xml ... encoding="utf-8"?>
+                tree = lxml_html.fromstring(html_content.encode('utf-8'), parser=self._utf8_parser)
         except Exception as e:
             logger.error(f"Failed to parse HTML: {e}")
-            return []
+            return ()
         
-        children = []
-        child_links = soup.find_all('a', href=re.compile(r'/child/'))
+        # Script/style contents are not part of any visible name
+        etree.strip_elements(tree, 'script', 'style', with_tail=False)
+        
+        pairs = []
+        child_links = self._child_links_xpath(tree)
         
         if not child_links and self.debug:
             logger.debug("No child links found - might be using unexpected HTML structure")
-            all_links = soup.find_all('a')
+            all_links = tree.iter('a')
             for link in all_links:
                 logger.debug(f"Found link: {link.get('href')}")
         
@@ -157,36 +302,148 @@ class ChildInfoExtractor:
                 
                 if not child_name or child_name == "Unknown":
                     logger.warning(f"Could not extract name for child ID: {child_id}")
-                    parent_row = a_tag.find_parent('div', {'class': 'row'})
-                    if parent_row:
-                        all_text = self._sanitize_text(parent_row.text)
-                        for common_text in ["overview", "profile", "details"]:
-                            all_text = all_text.replace(common_text, "")
+                    parent_rows = self._parent_row_xpath(a_tag)
+                    if parent_rows:
+                        all_text = self._sanitize_text(self._COMMON_TEXT_RE.sub("", parent_rows[0].text_content()))
                         if all_text:
                             child_name = all_text
                 
-                child_info = {
-                    'id': child_id,
-                    'name': child_name,
-                    'source': source,
-                    'extraction_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                # Check if this child is already in our list (avoid duplicates)
-                if not any(c['id'] == child_id for c in self.all_children):
-                    children.append(child_info)
-                    self.all_children.append(child_info)
+                pairs.append((child_id, child_name))
                 
             except Exception as e:
                 logger.error(f"Error processing child #{idx+1}: {e}")
                 continue
         
+        return tuple(pairs)
+    
+    def extract_from_html(self, html_content: str, source: str = "unknown") -> List[Dict[str, str]]:
+        """
+        Parse HTML and extract all child information.
+        
+        Args:
+            html_content: HTML string to parse
+            source: Source identifier for tracking
+            
+        Returns:
+            List of dictionaries with child information
+        """
+        if not html_content:
+            logger.warning("Empty HTML content provided")
+            return []
+        
+        # Re-pasted or re-read documents are served from the cache instead of re-parsed
+        key = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest()
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            self._parse_cache_hits += 1
+            pairs = cached
+        else:
+            pairs = self._parse_children(html_content)
+            self._parse_cache[key] = pairs
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+            self._parse_cache_misses += 1
+        if self.debug:
+            logger.debug(
+                f"Parse cache: hits={self._parse_cache_hits}, misses={self._parse_cache_misses}, "
+                f"size={len(self._parse_cache)}"
+            )
+        
+        return self._add_children(pairs, source)
+    
+    def extract_many(self, html_list: List[str], sources: Optional[List[str]] = None) -> List[List[Dict[str, str]]]:
+        """
+        Parse several independent HTML documents in parallel worker processes.
+        
+        Args:
+            html_list: HTML strings to parse
+            sources: Optional source identifiers, one per HTML string
+            
+        Returns:
+            One list of newly extracted child dictionaries per input document
+        """
+        if sources is None:
+            sources = ["unknown"] * len(html_list)
+        
+        return self._extract_in_pool(_parse_one, html_list, sources, self.extract_from_html)
+    
+    def _extract_in_pool(
+        self,
+        worker: Callable[[str, bool], Tuple[Tuple[str, str], ...]],
+        items: List[str],
+        sources: List[str],
+        fallback: Callable[[str, str], List[Dict[str, str]]]
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Run a module-level worker over items in a process pool and merge the results.
+        
+        Results are merged in input order so de-duplication matches sequential
+        processing. Items the pool could not handle - a single item, a pool that
+        fails to start or breaks, or a worker error - go through fallback instead.
+        
+        Args:
+            worker: Picklable function taking (item, debug) and returning (id, name) pairs
+            items: HTML strings or file paths, one per source
+            sources: Source identifiers, one per item
+            fallback: Sequential equivalent taking (item, source)
+            
+        Returns:
+            One list of newly extracted child dictionaries per item
+        """
+        if len(items) < 2:
+            return [fallback(item, source) for item, source in zip(items, sources)]
+        
+        try:
+            executor = ProcessPoolExecutor(max_workers=min(len(items), os.cpu_count() or 1))
+        except Exception as e:
+            logger.error(f"Parallel extraction failed, processing sequentially: {e}")
+            return [fallback(item, source) for item, source in zip(items, sources)]
+        
+        results = []
+        with executor:
+            futures = [executor.submit(worker, item, self.debug) for item in items]
+            for item, source, future in zip(items, sources, futures):
+                try:
+                    pairs = future.result()
+                except BrokenProcessPool as e:
+                    logger.error(f"Worker process failed, processing {source} sequentially: {e}")
+                    results.append(fallback(item, source))
+                    continue
+                except Exception:
+                    # Let the sequential path redo the item and report its error
+                    results.append(fallback(item, source))
+                    continue
+                results.append(self._add_children(pairs, source))
+        
+        return results
+    
+    def _add_children(self, pairs: Tuple[Tuple[str, str], ...], source: str) -> List[Dict[str, str]]:
+        """Record new (id, name) pairs from one source, skipping IDs already collected."""
+        children = []
+        extraction_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        for child_id, child_name in pairs:
+            # Check if this child is already in our list (avoid duplicates)
+            if child_id not in self._seen_ids:
+                self._seen_ids.add(child_id)
+                children.append({
+                    'id': child_id,
+                    'name': child_name,
+                    'source': source,
+                    'extraction_time': extraction_time
+                })
+                self._ids.append(child_id)
+                self._names.append(child_name)
+                self._sources.append(source)
+                self._times.append(extraction_time)
+        
         if not children:
             logger.warning(f"No children extracted from source: {source}")
             
         return children
     
-    def export_to_csv(self, filename: str = None) -> str:
+    def export_to_csv(self, filename: Optional[str] = None) -> str:
         """
         Export all extracted children to CSV file
         
@@ -196,7 +453,7 @@ class ChildInfoExtractor:
         Returns:
             Path to the created CSV file
         """
-        if not self.all_children:
+        if not self._ids:
             logger.warning("No children to export")
             return ""
             
@@ -205,22 +462,37 @@ class ChildInfoExtractor:
             filename = f"child_data_{timestamp}.csv"
             
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['id', 'name', 'source', 'extraction_time']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for child in self.all_children:
-                    writer.writerow(child)
+            # Rows are formatted into ~1 MiB text chunks, each encoded once and written
+            # straight to the file descriptor, bypassing the text I/O layer
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(filename, flags, 0o644)
+            try:
+                lines = ['id,name,source,extraction_time\r\n']
+                size = 0
+                for row in zip(self._ids, self._names, self._sources, self._times):
+                    if _CSV_SPECIAL_RE.search(''.join(row)):
+                        line = ','.join(map(_quote_csv_field, row))
+                    else:
+                        line = ','.join(row)
+                    lines.append(line)
+                    lines.append('\r\n')
+                    size += len(line)
+                    if size >= _CSV_FLUSH_SIZE:
+                        _write_all(fd, ''.join(lines).encode('utf-8'))
+                        lines.clear()
+                        size = 0
+                _write_all(fd, ''.join(lines).encode('utf-8'))
+            finally:
+                os.close(fd)
                     
-            logger.info(f"Successfully exported {len(self.all_children)} children to {filename}")
+            logger.info(f"Successfully exported {self.child_count} children to {filename}")
             return os.path.abspath(filename)
             
         except Exception as e:
             logger.error(f"Failed to export to CSV: {e}")
             return ""
     
-    def export_to_excel(self, filename: str = None) -> str:
+    def export_to_excel(self, filename: Optional[str] = None) -> str:
         """
         Export all extracted children to Excel file
         
@@ -230,15 +502,15 @@ class ChildInfoExtractor:
         Returns:
             Path to the created Excel file
         """
-        if not self.all_children:
+        if not self._ids:
             logger.warning("No children to export")
             return ""
             
         try:
-            # Only import pandas when needed
-            import pandas as pd
+            # Only import xlsxwriter when needed
+            import xlsxwriter
         except ImportError:
-            logger.error("pandas is required for Excel export. Please install it with: pip install pandas openpyxl")
+            logger.error("xlsxwriter is required for Excel export. Please install it with: pip install xlsxwriter")
             return ""
             
         if not filename:
@@ -246,10 +518,18 @@ class ChildInfoExtractor:
             filename = f"child_data_{timestamp}.xlsx"
             
         try:
-            df = pd.DataFrame(self.all_children)
-            df.to_excel(filename, index=False, engine='openpyxl')
+            # constant_memory flushes each row to disk as soon as the next one starts
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+            try:
+                worksheet = workbook.add_worksheet()
+                worksheet.write_row(0, 0, ['id', 'name', 'source', 'extraction_time'])
+                rows = zip(self._ids, self._names, self._sources, self._times)
+                for row, values in enumerate(rows, start=1):
+                    worksheet.write_row(row, 0, values)
+            finally:
+                workbook.close()
             
-            logger.info(f"Successfully exported {len(self.all_children)} children to {filename}")
+            logger.info(f"Successfully exported {self.child_count} children to {filename}")
             return os.path.abspath(filename)
             
         except Exception as e:
@@ -257,7 +537,22 @@ class ChildInfoExtractor:
             return ""
 
 
-def main():
+def _parse_one(html_content: str, debug: bool = False) -> Tuple[Tuple[str, str], ...]:
+    """Process-pool worker: parse one HTML document with a throwaway extractor."""
+    if not html_content:
+        return ()
+    return ChildInfoExtractor(debug=debug)._parse_children(html_content)
+
+
+def _parse_path(file_path: str, debug: bool = False) -> Tuple[Tuple[str, str], ...]:
+    """Process-pool worker: read and parse one HTML file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    logger.info(f"Successfully read file: {file_path} ({len(html_content)} bytes)")
+    return _parse_one(html_content, debug)
+
+
+def main() -> None:
     """Command-line interface for the extractor."""
     parser = argparse.ArgumentParser(
         description='Extract child IDs and names from ChildPaths HTML files',
@@ -323,7 +618,7 @@ Examples:
         print(f"Extracted {len(children)} children from all files")
     
     # Output results
-    if not extractor.all_children:
+    if not extractor.child_count:
         print("\nNo children were extracted. Please check your input files.")
         return
     
@@ -341,12 +636,25 @@ Examples:
         filepath = extractor.export_to_csv(output_filename)
     
     if filepath:
-        print(f"\nSuccessfully exported {len(extractor.all_children)} children to: {filepath}")
+        print(f"\nSuccessfully exported {extractor.child_count} children to: {filepath}")
     else:
         print("\nFailed to export data. Check log for details.")
 
 
-def run_interactive_mode(extractor):
+def read_pasted_html() -> str:
+    """Read pasted HTML from stdin until EOF or a line containing only 'DONE'."""
+    print("\nPaste the HTML content below.")
+    print("End input with a line 'DONE', or Ctrl-D (Unix) / Ctrl-Z Enter (Windows).")
+    
+    chunks = []
+    for line in sys.stdin:
+        if line.rstrip('\r\n') == 'DONE':
+            break
+        chunks.append(line)
+    return ''.join(chunks)
+
+
+def run_interactive_mode(extractor: ChildInfoExtractor) -> None:
     """Run the interactive command-line interface."""
     print("\nInteractive Mode")
     print("This tool extracts child IDs and names from ChildPaths HTML files.")
@@ -359,9 +667,10 @@ def run_interactive_mode(extractor):
         print("3. Export current data")
         print("4. View summary of extracted data")
         print("5. Quit")
+        print("6. Paste HTML content")
         print("-"*60)
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = input("\nEnter your choice (1-6): ").strip()
         
         if choice == '1':
             file_path = input("Enter the path to the HTML file: ").strip()
@@ -385,7 +694,7 @@ def run_interactive_mode(extractor):
             print(f"Extracted {len(children)} children from all files")
             
         elif choice == '3':
-            if not extractor.all_children:
+            if not extractor.child_count:
                 print("No children to export. Please process some files first.")
                 continue
                 
@@ -413,15 +722,16 @@ def run_interactive_mode(extractor):
                 print("Invalid format. Please choose 'csv' or 'excel'.")
             
         elif choice == '4':
-            if not extractor.all_children:
+            if not extractor.child_count:
                 print("No children have been extracted yet.")
                 continue
                 
-            print(f"\nExtracted {len(extractor.all_children)} children in total:")
+            all_children = extractor.all_children
+            print(f"\nExtracted {len(all_children)} children in total:")
             
             # Group by source
-            sources = {}
-            for child in extractor.all_children:
+            sources: Dict[str, int] = {}
+            for child in all_children:
                 source = child.get('source', 'unknown')
                 sources[source] = sources.get(source, 0) + 1
                 
@@ -431,15 +741,15 @@ def run_interactive_mode(extractor):
                 
             # Show sample of data
             print("\nSample data (first 5 entries):")
-            for i, child in enumerate(extractor.all_children[:5]):
+            for i, child in enumerate(all_children[:5]):
                 print(f"  {i+1}. {child['name']} (ID: {child['id']})")
                 
-            if len(extractor.all_children) > 5:
-                print(f"  ... and {len(extractor.all_children)-5} more")
+            if len(all_children) > 5:
+                print(f"  ... and {len(all_children)-5} more")
             
         elif choice == '5':
             # Ask if they want to save before quitting if they have data
-            if extractor.all_children:
+            if extractor.child_count:
                 save_action = input("Save data before quitting? (yes/no): ").strip().lower()
                 if save_action in ('yes', 'y'):
                     export_format = input("Export as CSV or Excel? (csv/excel): ").strip().lower()
@@ -465,8 +775,13 @@ def run_interactive_mode(extractor):
             print("\nThank you for using the ChildPaths Information Extractor. Goodbye!")
             break
         
+        elif choice == '6':
+            html_content = read_pasted_html()
+            children = extractor.extract_from_html(html_content, source="pasted")
+            print(f"Extracted {len(children)} children from the pasted HTML")
+            
         else:
-            print("Invalid choice. Please enter a number between 1 and 5.")
+            print("Invalid choice. Please enter a number between 1 and 6.")
 
 
 if __name__ == "__main__":